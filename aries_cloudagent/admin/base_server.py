@@ -31,6 +31,16 @@ class BaseAdminServer(ABC):
     ):
         """Add a webhook target."""
 
+    def add_webhook_targets(
+        self,
+        target_urls: Sequence[str],
+        topic_filter: Sequence[str] = None,
+        max_attempts: int = None,
+    ):
+        """Add multiple webhook targets sharing the same options."""
+        for target_url in target_urls:
+            self.add_webhook_target(target_url, topic_filter, max_attempts)
+
     @abstractmethod
     def remove_webhook_target(self, target_url: str):
         """Remove a webhook target."""
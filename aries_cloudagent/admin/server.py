@@ -466,6 +466,18 @@ class AdminServer(BaseAdminServer):
             target_url, topic_filter, max_attempts
         )
 
+    def add_webhook_targets(
+        self,
+        target_urls: Sequence[str],
+        topic_filter: Sequence[str] = None,
+        max_attempts: int = None,
+    ):
+        """Add multiple webhook targets sharing the same options."""
+        self.webhook_targets.update(
+            (url, WebhookTarget(url, topic_filter, max_attempts))
+            for url in dict.fromkeys(target_urls)
+        )
+
     def remove_webhook_target(self, target_url: str):
         """Remove a webhook target."""
         if target_url in self.webhook_targets:
@@ -96,6 +96,21 @@ class TestAdminServerBasic(AsyncTestCase):
         admin_server.remove_webhook_target(target_url=test_url)
         assert test_url not in admin_server.webhook_targets
 
+    @unittest_run_loop
+    async def test_responder_webhook_targets(self):
+        admin_server = self.get_admin_server()
+        test_urls = ["target_url_1", "target_url_2", "target_url_1"]
+        admin_server.add_webhook_targets(test_urls, max_attempts=3)
+        assert list(admin_server.webhook_targets) == ["target_url_1", "target_url_2"]
+
+        test_topic = "test_topic"
+        test_payload = {"test": "TEST"}
+        await admin_server.responder.send_webhook(test_topic, test_payload)
+        assert self.webhook_results == [
+            (test_topic, test_payload, "target_url_1", 3),
+            (test_topic, test_payload, "target_url_2", 3),
+        ]
+
     async def test_import_routes(self):
         # this test just imports all default admin routes
         # for routes with associated tests, this shouldn't make a difference in coverage
@@ -36,8 +36,13 @@ class BasicCache(BaseCache):
             The record found or `None`
 
         """
-        self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        item = self._cache.get(key)
+        if item:
+            expires = item["expires"]
+            if expires is None or time.perf_counter() < expires:
+                return item["value"]
+            del self._cache[key]
+        return None
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """
@@ -66,6 +66,16 @@ class TestBasicCache:
             item = await cache.get(key)
             assert item is None
 
+    @pytest.mark.asyncio
+    async def test_get_expired_removed(self, cache):
+        await cache.set("key", "value", 0.05)
+        await sleep(0.05)
+
+        item = await cache.get("key")
+        assert item is None
+        assert "key" not in cache._cache
+        assert await cache.get("valid key") == "value"
+
     @pytest.mark.asyncio
     async def test_flush(self, cache):
         await cache.flush()
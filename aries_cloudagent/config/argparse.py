@@ -562,6 +562,13 @@ class ProtocolGroup(ArgumentGroup):
             metavar="<log-path>",
             help="Write timing information to a given log file.",
         )
+        parser.add_argument(
+            "--timing-sample-rate",
+            type=int,
+            metavar="<rate>",
+            help="Only time one out of every <rate> calls when collecting\
+            timing information. Default: 1 (time every call).",
+        )
         parser.add_argument(
             "--trace", action="store_true", help="Generate tracing events.",
         )
@@ -604,6 +611,8 @@ class ProtocolGroup(ArgumentGroup):
             settings["timing.enabled"] = True
         if args.timing_log:
             settings["timing.log_file"] = args.timing_log
+        if args.timing_sample_rate:
+            settings["timing.sample_rate"] = args.timing_sample_rate
         # note that you can configure tracing without actually enabling it
         # this is to allow message- or exchange-specific tracing (vs global)
         settings["trace.target"] = "log"
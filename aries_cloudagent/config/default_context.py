@@ -37,7 +37,8 @@ class DefaultContextBuilder(ContextBuilder):
 
         if context.settings.get("timing.enabled"):
             timing_log = context.settings.get("timing.log_file")
-            collector = Collector(log_path=timing_log)
+            sample_rate = context.settings.get("timing.sample_rate", 1)
+            collector = Collector(log_path=timing_log, sample_rate=sample_rate)
             context.injector.bind_instance(Collector, collector)
 
         # Shared in-memory cache
@@ -15,6 +15,7 @@ class Injector(BaseInjector):
     ):
         """Initialize an `Injector`."""
         self.enforce_typing = enforce_typing
+        self._instances = {}
         self._providers = {}
         self._settings = Settings(settings)
 
@@ -31,6 +32,7 @@ class Injector(BaseInjector):
     def bind_instance(self, base_cls: type, instance: object):
         """Add a static instance as a class binding."""
         self._providers[base_cls] = InstanceProvider(instance)
+        self._instances[base_cls] = instance
 
     def bind_provider(
         self, base_cls: type, provider: BaseProvider, *, cache: bool = False
@@ -41,11 +43,13 @@ class Injector(BaseInjector):
         if cache and not isinstance(provider, CachedProvider):
             provider = CachedProvider(provider)
         self._providers[base_cls] = provider
+        self._instances.pop(base_cls, None)
 
     def clear_binding(self, base_cls: type):
         """Remove a previously-added binding."""
         if base_cls in self._providers:
             del self._providers[base_cls]
+        self._instances.pop(base_cls, None)
 
     def get_provider(self, base_cls: type):
         """Find the provider associated with a class binding."""
@@ -71,6 +75,13 @@ class Injector(BaseInjector):
         """
         if not base_cls:
             raise InjectorError("No base class provided for lookup")
+        if not settings:
+            # static instance bindings do not depend on the settings
+            instance = self._instances.get(base_cls)
+            if instance is not None and (
+                not self.enforce_typing or isinstance(instance, base_cls)
+            ):
+                return instance
         provider = self._providers.get(base_cls)
         ext_settings = self.settings.extend(settings) if settings else self.settings
         if provider:
@@ -93,6 +104,7 @@ class Injector(BaseInjector):
     def copy(self) -> BaseInjector:
         """Produce a copy of the injector instance."""
         result = Injector(self.settings)
+        result._instances = self._instances.copy()
         result._providers = self._providers.copy()
         return result
 
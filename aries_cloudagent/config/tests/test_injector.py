@@ -50,6 +50,25 @@ class TestInjector(AsyncTestCase):
         self.test_instance.bind_instance(str, self.test_value)
         assert (await self.test_instance.inject(str)) is self.test_value
 
+    async def test_inject_instance_rebind(self):
+        """Test replacing and clearing a static instance binding."""
+        self.test_instance.bind_instance(str, self.test_value)
+        assert (await self.test_instance.inject(str)) is self.test_value
+        mock_provider = MockProvider("NEWVAL")
+        self.test_instance.bind_provider(str, mock_provider)
+        assert (await self.test_instance.inject(str)) == "NEWVAL"
+        self.test_instance.bind_instance(str, self.test_value)
+        self.test_instance.clear_binding(str)
+        assert (await self.test_instance.inject(str, required=False)) is None
+
+    async def test_inject_instance_typing(self):
+        """Test enforcing the type of a static instance binding."""
+        self.test_instance.bind_instance(str, 1)
+        with self.assertRaises(InjectorError):
+            await self.test_instance.inject(str)
+        self.test_instance.enforce_typing = False
+        assert (await self.test_instance.inject(str)) == 1
+
     async def test_inject_provider(self):
         """Test a provider injection."""
         mock_provider = MockProvider(self.test_value)
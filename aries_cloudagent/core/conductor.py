@@ -8,6 +8,8 @@ wallet.
 
 """
 
+import asyncio
+import functools
 import hashlib
 import logging
 
@@ -29,13 +31,17 @@ from ..transport.outbound.base import OutboundDeliveryError
 from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.wire_format import BaseWireFormat
-from ..utils.task_queue import CompletedTask, TaskQueue
+from ..utils.task_queue import CompletedTask
 from ..utils.stats import Collector
 
 from .dispatcher import Dispatcher
 
 LOGGER = logging.getLogger(__name__)
 
+# Fixed DID seeds for the static test-suite connection
+_TEST_SUBJECT_SEED = hashlib.sha256(b"aries-protocol-test-subject").digest()
+_TEST_SUITE_SEED = hashlib.sha256(b"aries-protocol-test-suite").digest()
+
 
 class Conductor:
     """
@@ -86,11 +92,13 @@ class Conductor:
         )
         await self.outbound_transport_manager.setup()
 
+        settings = context.settings
+
         # Admin API
-        if context.settings.get("admin.enabled"):
+        if settings.get("admin.enabled"):
             try:
-                admin_host = context.settings.get("admin.host", "0.0.0.0")
-                admin_port = context.settings.get("admin.port", "80")
+                admin_host = settings.get("admin.host", "0.0.0.0")
+                admin_port = settings.get("admin.port", "80")
                 self.admin_server = AdminServer(
                     admin_host,
                     admin_port,
@@ -100,10 +108,9 @@ class Conductor:
                     self.dispatcher.task_queue,
                     self.get_stats,
                 )
-                webhook_urls = context.settings.get("admin.webhook_urls")
+                webhook_urls = settings.get("admin.webhook_urls")
                 if webhook_urls:
-                    for url in webhook_urls:
-                        self.admin_server.add_webhook_target(url)
+                    self.admin_server.add_webhook_targets(webhook_urls)
                 context.injector.bind_instance(BaseAdminServer, self.admin_server)
                 if "http" not in self.outbound_transport_manager.registered_schemes:
                     self.outbound_transport_manager.register("http")
@@ -115,19 +122,12 @@ class Conductor:
         collector = await context.inject(Collector, required=False)
         if collector:
             # add stats to our own methods
-            collector.wrap(
-                self,
-                (
-                    # "inbound_message_router",
-                    "outbound_message_router",
-                    # "create_inbound_session",
-                ),
-            )
+            collector.wrap(self, "outbound_message_router")
             # at the class level (!) should not be performed multiple times
             collector.wrap(
                 ConnectionManager,
                 (
-                    # "get_connection_targets",
+                    "get_connection_targets",
                     "fetch_did_document",
                     "find_inbound_connection",
                 ),
@@ -140,24 +140,10 @@ class Conductor:
 
         context = self.context
 
-        # Configure the wallet
-        public_did = await wallet_config(context)
+        # The wallet and ledger must be ready before any inbound messages arrive
+        public_did = await self.configure_wallet_ledger(context)
 
-        # Configure the ledger
-        if not await ledger_config(context, public_did):
-            LOGGER.warning("No ledger configured")
-
-        # Start up transports
-        try:
-            await self.inbound_transport_manager.start()
-        except Exception:
-            LOGGER.exception("Unable to start inbound transports")
-            raise
-        try:
-            await self.outbound_transport_manager.start()
-        except Exception:
-            LOGGER.exception("Unable to start outbound transports")
-            raise
+        await self.start_transports()
 
         # Start up Admin server
         if self.admin_server:
@@ -170,8 +156,10 @@ class Conductor:
             # for example
             context.injector.bind_instance(BaseResponder, self.admin_server.responder)
 
+        settings = context.settings
+
         # Get agent label
-        default_label = context.settings.get("default_label")
+        default_label = settings.get("default_label")
 
         # Show some details about the configuration to the user
         LoggingConfigurator.print_banner(
@@ -183,12 +171,12 @@ class Conductor:
         )
 
         # Create a static connection for use by the test-suite
-        if context.settings.get("debug.test_suite_endpoint"):
-            mgr = ConnectionManager(self.context)
-            their_endpoint = context.settings["debug.test_suite_endpoint"]
+        their_endpoint = settings.get("debug.test_suite_endpoint")
+        if their_endpoint:
+            mgr = ConnectionManager(context)
             test_conn = await mgr.create_static_connection(
-                my_seed=hashlib.sha256(b"aries-protocol-test-subject").digest(),
-                their_seed=hashlib.sha256(b"aries-protocol-test-suite").digest(),
+                my_seed=_TEST_SUBJECT_SEED,
+                their_seed=_TEST_SUITE_SEED,
                 their_endpoint=their_endpoint,
                 their_role="tester",
                 alias="test-suite",
@@ -199,35 +187,79 @@ class Conductor:
             print(" - Their endpoint:", their_endpoint)
             print()
 
-        # Print an invitation to the terminal
-        if context.settings.get("debug.print_invitation"):
-            try:
-                mgr = ConnectionManager(self.context)
-                _connection, invitation = await mgr.create_invitation(
-                    their_role=context.settings.get("debug.invite_role"),
-                    my_label=context.settings.get("debug.invite_label"),
-                    multi_use=context.settings.get("debug.invite_multi_use", False),
-                    public=context.settings.get("debug.invite_public", False),
-                )
-                base_url = context.settings.get("invite_base_url")
-                invite_url = invitation.to_url(base_url)
-                print("Invitation URL:")
-                print(invite_url, flush=True)
-            except Exception:
-                LOGGER.exception("Error creating invitation")
+        # Print an invitation to the terminal, without holding up startup
+        if settings.get("debug.print_invitation"):
+            self.dispatcher.run_task(self.print_invitation(context))
+
+    async def print_invitation(self, context: InjectionContext):
+        """Create a connection invitation and print it to the terminal."""
+        settings = context.settings
+        try:
+            mgr = ConnectionManager(context)
+            _connection, invitation = await mgr.create_invitation(
+                their_role=settings.get("debug.invite_role"),
+                my_label=settings.get("debug.invite_label"),
+                multi_use=settings.get("debug.invite_multi_use", False),
+                public=settings.get("debug.invite_public", False),
+            )
+            base_url = settings.get("invite_base_url")
+            invite_url = invitation.to_url(base_url)
+            print("Invitation URL:")
+            print(invite_url, flush=True)
+        except Exception:
+            LOGGER.exception("Error creating invitation")
+
+    async def configure_wallet_ledger(self, context: InjectionContext) -> str:
+        """
+        Configure the wallet and ledger.
+
+        Returns:
+            The public DID of the wallet, if any
+
+        """
+        public_did = await wallet_config(context)
+
+        if not await ledger_config(context, public_did):
+            LOGGER.warning("No ledger configured")
+
+        return public_did
+
+    async def start_transports(self):
+        """Start up the inbound and outbound transports."""
+        try:
+            await self.inbound_transport_manager.start()
+        except Exception:
+            LOGGER.exception("Unable to start inbound transports")
+            raise
+        try:
+            await self.outbound_transport_manager.start()
+        except Exception:
+            LOGGER.exception("Unable to start outbound transports")
+            raise
 
     async def stop(self, timeout=1.0):
         """Stop the agent."""
-        shutdown = TaskQueue()
+        shutdown = []
         if self.dispatcher:
-            shutdown.run(self.dispatcher.complete())
+            shutdown.append(self.dispatcher.complete())
         if self.admin_server:
-            shutdown.run(self.admin_server.stop())
+            shutdown.append(self.admin_server.stop())
         if self.inbound_transport_manager:
-            shutdown.run(self.inbound_transport_manager.stop())
+            shutdown.append(self.inbound_transport_manager.stop())
         if self.outbound_transport_manager:
-            shutdown.run(self.outbound_transport_manager.stop())
-        await shutdown.complete(timeout)
+            shutdown.append(self.outbound_transport_manager.stop())
+        if not shutdown:
+            return
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*shutdown, return_exceptions=True), timeout
+            )
+        except asyncio.TimeoutError:
+            LOGGER.warning("Timed out waiting for agent shutdown")
+            return
+        for result in results:
+            if isinstance(result, Exception):
+                LOGGER.error("Error during agent shutdown", exc_info=result)
 
     def inbound_message_router(
         self, message: InboundMessage, can_respond: bool = False
@@ -241,7 +273,7 @@ class Conductor:
 
         """
 
-        if message.receipt.direct_response_requested and not can_respond:
+        if not can_respond and message.receipt.direct_response_requested:
             LOGGER.warning(
                 "Direct response requested, but not supported by transport: %s",
                 message.transport_type,
@@ -254,7 +286,7 @@ class Conductor:
             message,
             self.outbound_message_router,
             self.admin_server and self.admin_server.send_webhook,
-            lambda completed: self.dispatch_complete(message, completed),
+            functools.partial(self.dispatch_complete, message),
         )
 
     def dispatch_complete(self, message: InboundMessage, completed: CompletedTask):
@@ -267,20 +299,16 @@ class Conductor:
 
     async def get_stats(self) -> dict:
         """Get the current stats tracked by the conductor."""
+        out_states = self.outbound_transport_manager.state_counts
         stats = {
             "in_sessions": len(self.inbound_transport_manager.sessions),
-            "out_encode": 0,
-            "out_deliver": 0,
+            "out_encode": out_states[QueuedOutboundMessage.STATE_ENCODE],
+            "out_deliver": out_states[QueuedOutboundMessage.STATE_DELIVER],
             "task_active": self.dispatcher.task_queue.current_active,
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
         }
-        for m in self.outbound_transport_manager.outbound_buffer:
-            if m.state == QueuedOutboundMessage.STATE_ENCODE:
-                stats["out_encode"] += 1
-            if m.state == QueuedOutboundMessage.STATE_DELIVER:
-                stats["out_deliver"] += 1
         return stats
 
     async def outbound_message_router(
@@ -326,12 +354,15 @@ class Conductor:
             inbound: The inbound message that produced this response, if available
         """
         # populate connection target(s)
-        if not outbound.target and not outbound.target_list and outbound.connection_id:
+        needs_targets = outbound.connection_id and not (
+            outbound.target or outbound.target_list
+        )
+        if needs_targets:
             # using provided request context
             mgr = ConnectionManager(context)
             try:
-                outbound.target_list = await self.dispatcher.run_task(
-                    mgr.get_connection_targets(connection_id=outbound.connection_id)
+                outbound.target_list = await mgr.get_connection_targets(
+                    connection_id=outbound.connection_id
                 )
             except ConnectionManagerError:
                 LOGGER.exception("Error preparing outbound message for transmission")
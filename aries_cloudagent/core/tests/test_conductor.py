@@ -134,10 +134,10 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
         ) as mock_logger:
 
             mock_inbound_mgr.return_value.sessions = ["dummy"]
-            mock_outbound_mgr.return_value.outbound_buffer = [
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
-            ]
+            mock_outbound_mgr.return_value.state_counts = {
+                QueuedOutboundMessage.STATE_ENCODE: 1,
+                QueuedOutboundMessage.STATE_DELIVER: 2,
+            }
 
             await conductor.setup()
 
@@ -154,6 +154,9 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                     "task_pending",
                 ]
             )
+            assert stats["in_sessions"] == 1
+            assert stats["out_encode"] == 1
+            assert stats["out_deliver"] == 2
 
     async def test_setup_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -201,6 +204,13 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             assert mock_dispatch.call_args[0][2] is None  # admin webhook router
             assert callable(mock_dispatch.call_args[0][3])
 
+            with async_mock.patch.object(
+                conductor.inbound_transport_manager, "dispatch_complete"
+            ) as mock_complete:
+                completed = async_mock.MagicMock(exc_info=None)
+                mock_dispatch.call_args[0][3](completed)
+                mock_complete.assert_called_once_with(message, completed)
+
     async def test_outbound_message_handler_return_route(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         conductor = test_module.Conductor(builder)
@@ -329,15 +339,13 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
 
             conductor.handle_not_returned(conductor.context, message)
 
+            mock_get_targets = async_mock.CoroutineMock(
+                side_effect=test_module.ConnectionManagerError()
+            )
             with async_mock.patch.object(
                 test_module, "ConnectionManager"
-            ) as mock_conn_mgr, async_mock.patch.object(
-                conductor.dispatcher, "run_task", async_mock.CoroutineMock()
-            ) as mock_run_task:
-                mock_conn_mgr.return_value.get_connection_targets = (
-                    async_mock.CoroutineMock()
-                )
-                mock_run_task.side_effect = test_module.ConnectionManagerError()
+            ) as mock_conn_mgr:
+                mock_conn_mgr.return_value.get_connection_targets = mock_get_targets
                 await conductor.queue_outbound(conductor.context, message)
                 mock_outbound_mgr.return_value.enqueue_message.assert_not_called()
 
@@ -346,7 +354,7 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                     test_module.OutboundDeliveryError()
                 )
                 await conductor.queue_outbound(conductor.context, message)
-                mock_run_task.assert_called_once()
+                mock_get_targets.assert_awaited_once()
 
     async def test_admin(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
@@ -368,6 +376,43 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             await conductor.stop()
             admin_stop.assert_awaited_once_with()
 
+    async def test_stop_x(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+
+        with async_mock.patch.object(
+            conductor.inbound_transport_manager,
+            "stop",
+            async_mock.CoroutineMock(side_effect=KeyError("trouble")),
+        ) as mock_in_stop, async_mock.patch.object(
+            conductor.outbound_transport_manager, "stop", async_mock.CoroutineMock()
+        ) as mock_out_stop, async_mock.patch.object(
+            test_module, "LOGGER", async_mock.MagicMock()
+        ) as mock_logger:
+            await conductor.stop()
+            mock_in_stop.assert_awaited_once_with()
+            mock_out_stop.assert_awaited_once_with()
+            mock_logger.error.assert_called_once()
+
+    async def test_stop_timeout(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+
+        async def slow_stop():
+            await asyncio.sleep(1)
+
+        with async_mock.patch.object(
+            conductor.outbound_transport_manager, "stop", slow_stop
+        ), async_mock.patch.object(
+            test_module, "LOGGER", async_mock.MagicMock()
+        ) as mock_logger:
+            await conductor.stop(timeout=0.01)
+            mock_logger.warning.assert_called_once()
+
     async def test_admin_startx(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         builder.update_settings({"admin.enabled": "1", "debug.print_invitation": "1"})
@@ -457,6 +502,25 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             with self.assertRaises(KeyError):
                 await conductor.start()
 
+    async def test_start_x_wallet(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        with async_mock.patch.object(
+            test_module,
+            "wallet_config",
+            async_mock.CoroutineMock(side_effect=KeyError("trouble")),
+        ), async_mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, async_mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr:
+            await conductor.setup()
+            with self.assertRaises(KeyError):
+                await conductor.start()
+            mock_inbound_mgr.return_value.start.assert_not_awaited()
+            mock_outbound_mgr.return_value.start.assert_not_awaited()
+
     async def test_dispatch_complete(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         conductor = test_module.Conductor(builder)
@@ -488,6 +552,7 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
         with async_mock.patch("sys.stdout", new=StringIO()) as captured:
             await conductor.setup()
             await conductor.start()
+            await conductor.dispatcher.task_queue.flush()
             await conductor.stop()
             assert "http://localhost?c_i=" in captured.getvalue()
 
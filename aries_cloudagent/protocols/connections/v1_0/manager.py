@@ -966,6 +966,10 @@ class ConnectionManager:
         cache: BaseCache = await self.context.inject(BaseCache, required=False)
         cache_key = f"connection_target::{connection_id}"
         if cache:
+            # skip acquiring the key lock when the targets are already cached
+            cached = await cache.get(cache_key)
+            if cached:
+                return [ConnectionTarget.deserialize(row) for row in cached]
             async with cache.acquire(cache_key) as entry:
                 if entry.result:
                     targets = [
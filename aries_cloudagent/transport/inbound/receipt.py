@@ -85,7 +85,8 @@ class MessageReceipt:
             This context's requested direct response mode
 
         """
-        return self._direct_response_mode and self._direct_response_mode != "none"
+        mode = self._direct_response_mode
+        return mode and mode != self.REPLY_MODE_NONE
 
     @property
     def in_time(self) -> str:
@@ -32,6 +32,20 @@ MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
 class QueuedOutboundMessage:
     """Class representing an outbound message pending delivery."""
 
+    __slots__ = (
+        "context",
+        "endpoint",
+        "error",
+        "message",
+        "payload",
+        "retries",
+        "retry_at",
+        "state",
+        "target",
+        "task",
+        "transport_id",
+    )
+
     STATE_NEW = "new"
     STATE_PENDING = "pending"
     STATE_ENCODE = "encode"
@@ -84,7 +98,12 @@ class OutboundTransportManager:
         self.outbound_new = []
         self.registered_schemes = {}
         self.registered_transports = {}
+        self.running_schemes = {}
         self.running_transports = {}
+        self.state_counts = {
+            QueuedOutboundMessage.STATE_ENCODE: 0,
+            QueuedOutboundMessage.STATE_DELIVER: 0,
+        }
         self.task_queue = TaskQueue(max_active=200)
         self._process_task: asyncio.Task = None
         if self.context.settings.get("transport.max_outbound_retry"):
@@ -173,6 +192,8 @@ class OutboundTransportManager:
         transport.collector = await self.context.inject(Collector, required=False)
         await transport.start()
         self.running_transports[transport_id] = transport
+        for scheme in transport.schemes:
+            self.running_schemes.setdefault(scheme, transport_id)
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
@@ -186,6 +207,7 @@ class OutboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        self.running_schemes = {}
         self.running_transports = {}
 
     def get_registered_transport_for_scheme(self, scheme: str) -> str:
@@ -201,14 +223,7 @@ class OutboundTransportManager:
 
     def get_running_transport_for_scheme(self, scheme: str) -> str:
         """Find the running transport ID for a given scheme."""
-        try:
-            return next(
-                transport_id
-                for transport_id, transport in self.running_transports.items()
-                if scheme in transport.schemes
-            )
-        except StopIteration:
-            pass
+        return self.running_schemes.get(scheme)
 
     def get_running_transport_for_endpoint(self, endpoint: str):
         """Find the running transport ID to use for a given endpoint."""
@@ -277,11 +292,20 @@ class OutboundTransportManager:
         queued = QueuedOutboundMessage(None, None, None, transport_id)
         queued.endpoint = f"{endpoint}/topic/{topic}/"
         queued.payload = json.dumps(payload)
-        queued.state = QueuedOutboundMessage.STATE_PENDING
+        self.update_state(queued, QueuedOutboundMessage.STATE_PENDING)
         queued.retries = 4 if max_attempts is None else max_attempts - 1
         self.outbound_new.append(queued)
         self.process_queued()
 
+    def update_state(self, queued: QueuedOutboundMessage, state: str):
+        """Update the state of a queued message, maintaining the state counts."""
+        counts = self.state_counts
+        if queued.state in counts:
+            counts[queued.state] -= 1
+        if state in counts:
+            counts[state] += 1
+        queued.state = state
+
     def process_queued(self) -> asyncio.Task:
         """
         Start the process to deliver queued messages if necessary.
@@ -338,7 +362,7 @@ class OutboundTransportManager:
                         deliver = True
 
                 if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
+                    self.update_state(queued, QueuedOutboundMessage.STATE_DELIVER)
                     p_time = trace_event(
                         self.context.settings,
                         queued.message if queued.message else queued.payload,
@@ -364,10 +388,10 @@ class OutboundTransportManager:
                 if queued.state == QueuedOutboundMessage.STATE_NEW:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
-                        queued.state = QueuedOutboundMessage.STATE_PENDING
+                        self.update_state(queued, QueuedOutboundMessage.STATE_PENDING)
                         new_pending += 1
                     else:
-                        queued.state = QueuedOutboundMessage.STATE_ENCODE
+                        self.update_state(queued, QueuedOutboundMessage.STATE_ENCODE)
                         p_time = trace_event(
                             self.context.settings,
                             queued.message if queued.message else queued.payload,
@@ -418,9 +442,9 @@ class OutboundTransportManager:
         """Handle completion of queued message encoding."""
         if completed.exc_info:
             queued.error = completed.exc_info
-            queued.state = QueuedOutboundMessage.STATE_DONE
+            self.update_state(queued, QueuedOutboundMessage.STATE_DONE)
         else:
-            queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.update_state(queued, QueuedOutboundMessage.STATE_PENDING)
         queued.task = None
         self.process_queued()
 
@@ -444,17 +468,17 @@ class OutboundTransportManager:
                     queued.endpoint,
                 )
                 queued.retries -= 1
-                queued.state = QueuedOutboundMessage.STATE_RETRY
+                self.update_state(queued, QueuedOutboundMessage.STATE_RETRY)
                 queued.retry_at = time.perf_counter() + 10
             else:
                 LOGGER.exception(
                     "Outbound message could not be delivered", exc_info=queued.error,
                 )
                 LOGGER.error(">>> NOT Re-queued, state is DONE, failed to deliver msg.")
-                queued.state = QueuedOutboundMessage.STATE_DONE
+                self.update_state(queued, QueuedOutboundMessage.STATE_DONE)
         else:
             queued.error = None
-            queued.state = QueuedOutboundMessage.STATE_DONE
+            self.update_state(queued, QueuedOutboundMessage.STATE_DONE)
         queued.task = None
         self.process_queued()
 
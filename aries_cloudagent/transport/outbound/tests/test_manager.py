@@ -70,6 +70,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         await mgr.task_queue
         transport.start.assert_awaited_once_with()
         assert mgr.get_running_transport_for_scheme("http") == "transport_cls"
+        assert mgr.running_schemes == {"http": "transport_cls"}
 
         message = OutboundMessage(payload="{}")
         assert "payload" in str(message)
@@ -95,6 +96,10 @@ class TestOutboundTransportManager(AsyncTestCase):
             transport.wire_format.encode_message.return_value,
             message.target.endpoint,
         )
+        assert mgr.state_counts == {
+            QueuedOutboundMessage.STATE_ENCODE: 0,
+            QueuedOutboundMessage.STATE_DELIVER: 0,
+        }
 
         with self.assertRaises(OutboundDeliveryError):
             mgr.get_running_transport_for_endpoint("localhost")
@@ -109,6 +114,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         await mgr.stop()
 
         assert mgr.get_running_transport_for_scheme("http") is None
+        assert mgr.running_schemes == {}
         transport.stop.assert_awaited_once_with()
 
     async def test_stop_cancel(self):
@@ -155,6 +161,12 @@ class TestOutboundTransportManager(AsyncTestCase):
             assert queued.retries == test_attempts - 1
             assert queued.state == QueuedOutboundMessage.STATE_PENDING
 
+    def test_queued_message_slots(self):
+        queued = QueuedOutboundMessage(None, None, None, "transport_id")
+        assert queued.state == QueuedOutboundMessage.STATE_NEW
+        with self.assertRaises(AttributeError):
+            queued.unknown = True
+
     async def test_process_done_x(self):
         mock_task = async_mock.MagicMock(
             done=async_mock.MagicMock(return_value=True),
@@ -178,7 +190,10 @@ class TestOutboundTransportManager(AsyncTestCase):
         with async_mock.patch.object(
             mgr, "process_queued", async_mock.MagicMock()
         ) as mock_mgr_process:
+            mock_queued.state = QueuedOutboundMessage.STATE_ENCODE
+            mgr.state_counts[QueuedOutboundMessage.STATE_ENCODE] = 1
             mgr.finished_encode(mock_queued, mock_task)
+            assert mgr.state_counts[QueuedOutboundMessage.STATE_ENCODE] == 0
             mgr.finished_deliver(mock_queued, mock_task)
             mgr.finished_deliver(mock_queued, mock_task)
 
@@ -2,7 +2,9 @@
 
 import functools
 import inspect
+import itertools
 import time
+from collections import defaultdict
 from typing import Sequence, TextIO, Union
 
 
@@ -97,11 +99,24 @@ class Timer:
 class Collector:
     """Collector for a set of statistics."""
 
-    def __init__(self, *, enabled: bool = True, log_path: str = None):
-        """Initialize the Collector instance."""
+    def __init__(
+        self, *, enabled: bool = True, log_path: str = None, sample_rate: int = 1
+    ):
+        """
+        Initialize the Collector instance.
+
+        Args:
+            enabled: Whether statistics are recorded
+            log_path: An optional path for writing timing entries
+            sample_rate: Only time one out of every `sample_rate` calls to
+                each wrapped function
+
+        """
+        self._calls = defaultdict(itertools.count)
         self._enabled = enabled
         self._log_file: TextIO = None
         self._log_path = log_path
+        self._sample_rate = max(int(sample_rate or 1), 1)
         self._stats = None
         self.reset()
 
@@ -114,6 +129,11 @@ class Collector:
         if self._log_path:
             self._log_file = open(self._log_path, "w")
 
+    @property
+    def sample_rate(self) -> int:
+        """Accessor for the collector's sample rate."""
+        return self._sample_rate
+
     @property
     def enabled(self) -> bool:
         """Accessor for the collector's enabled property."""
@@ -160,23 +180,51 @@ class Collector:
 
     def wrap_fn(self, fn, groups: Sequence[str]):
         """Wrap a function instance to collect timing statistics on execution."""
+        sample_rate = self._sample_rate
+
+        if sample_rate > 1:
+            calls = self._calls[fn.__qualname__]
 
-        @functools.wraps(fn)
-        def wrapped(*args, **kwargs):
-            with self.timer(*groups):
-                result = fn(*args, **kwargs)
-            return result
+            @functools.wraps(fn)
+            def wrapped(*args, **kwargs):
+                if next(calls) % sample_rate:
+                    return fn(*args, **kwargs)
+                with self.timer(*groups):
+                    result = fn(*args, **kwargs)
+                return result
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapped(*args, **kwargs):
+                with self.timer(*groups):
+                    result = fn(*args, **kwargs)
+                return result
 
         return wrapped
 
     def wrap_coro(self, fn, groups: Sequence[str]):
         """Wrap a coroutine instance to collect timing statistics on execution."""
+        sample_rate = self._sample_rate
+
+        if sample_rate > 1:
+            calls = self._calls[fn.__qualname__]
+
+            @functools.wraps(fn)
+            async def wrapped(*args, **kwargs):
+                if next(calls) % sample_rate:
+                    return await fn(*args, **kwargs)
+                with self.timer(*groups):
+                    result = await fn(*args, **kwargs)
+                return result
+
+        else:
 
-        @functools.wraps(fn)
-        async def wrapped(*args, **kwargs):
-            with self.timer(*groups):
-                result = await fn(*args, **kwargs)
-            return result
+            @functools.wraps(fn)
+            async def wrapped(*args, **kwargs):
+                with self.timer(*groups):
+                    result = await fn(*args, **kwargs)
+                return result
 
         return wrapped
 
@@ -62,6 +62,31 @@ class TestStats(AsyncTestCase):
         with self.assertRaises(ValueError):
             stats.wrap(instance, "")
 
+    async def test_sample_rate(self):
+        stats = Collector(sample_rate=2)
+        assert stats.sample_rate == 2
+
+        class TestClass:
+            def test(self):
+                return 1
+
+            async def test_async(self):
+                return self.test() + 1
+
+        instance = TestClass()
+        stats.wrap(instance, ("test", "test_async"))
+        for _ in range(100):
+            assert await instance.test_async() == 2
+
+        # each function is sampled on its own, even when the calls alternate
+        counts = stats.results["count"]
+        assert counts == {
+            "TestStats.test_sample_rate.<locals>.TestClass.test": 50,
+            "TestStats.test_sample_rate.<locals>.TestClass.test_async": 50,
+        }
+
+        assert Collector(sample_rate=None).sample_rate == 1
+
     async def test_disable(self):
         stats = Collector()
         assert stats.enabled